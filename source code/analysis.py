@@ -4,50 +4,67 @@ Role D (Analysis):
 
 Shared contracts:
 - stocks: {"AAPL": {"initial_price": 150.0, "current_price": 165.0}, ...}
+          (data_io.load_stocks returns a data_io.Stocks, which reads the same way)
 - portfolio: {"AAPL": 3, "MSFT": 1, ...}  # only tickers with qty > 0
 """
 
 from __future__ import annotations
 
-from typing import Dict
+import math
+import operator
+from typing import Dict, List, Mapping, Tuple
 
+import data_io
 
-def _validate_inputs(portfolio: Dict[str, int], stocks: Dict[str, Dict[str, float]]) -> None:
+# math.sumprod (Python 3.12+) runs the whole multiply-accumulate loop in C.
+_sumprod = getattr(math, "sumprod", None)
+
+
+def _validate_inputs(portfolio: Dict[str, int], stocks: Mapping[str, Mapping[str, float]]) -> None:
     """
         Internal helper: validate that portfolio and stocks roughly match the agreed data shapes.
   """
     if not isinstance(portfolio, dict):
         raise TypeError("portfolio must be a dict like {'AAPL': 3, 'MSFT': 1}")
-    if not isinstance(stocks, dict):
+    if not isinstance(stocks, Mapping):
         raise TypeError("stocks must be a dict like {'AAPL': {'initial_price': 150.0, 'current_price': 165.0}}")
 
-    # Check portfolio quantities are integers and positive (per contract: only tickers with qty > 0)
-    for symbol, qty in portfolio.items():
-        if not isinstance(symbol, str):
-            raise TypeError("portfolio keys (symbols) must be strings.")
-        if not isinstance(qty, int):
-            raise TypeError(f"portfolio quantity for {symbol} must be int, got {type(qty).__name__}.")
-        if qty <= 0:
-            raise ValueError(f"portfolio must only contain tickers with qty > 0. Found {symbol}: {qty}.")
-
-    # Check stock entries shape
-    for symbol, price_info in stocks.items():
-        if not isinstance(symbol, str):
-            raise TypeError("stocks keys (symbols) must be strings.")
-        if not isinstance(price_info, dict):
-            raise TypeError(
-                f"stocks[{symbol}] must be a dict like {{'initial_price': ..., 'current_price': ...}}."
-            )
+    # Check portfolio quantities are integers and positive (per contract: only tickers with qty > 0).
+    # Fast path: one all() over the holdings; the loop below only runs to find what is wrong.
+    if not all(type(symbol) is str and type(qty) is int and qty > 0 for symbol, qty in portfolio.items()):
+        for symbol, qty in portfolio.items():
+            if not isinstance(symbol, str):
+                raise TypeError("portfolio keys (symbols) must be strings.")
+            if not isinstance(qty, int):
+                raise TypeError(f"portfolio quantity for {symbol} must be int, got {type(qty).__name__}.")
+            if qty <= 0:
+                raise ValueError(f"portfolio must only contain tickers with qty > 0. Found {symbol}: {qty}.")
+
+    # Check stock entries shape (data_io.Stocks checks its prices when it is built)
+    if isinstance(stocks, data_io.Stocks):
+        return
+    if not all(type(symbol) is str and type(price_info) is dict for symbol, price_info in stocks.items()):
+        for symbol, price_info in stocks.items():
+            if not isinstance(symbol, str):
+                raise TypeError("stocks keys (symbols) must be strings.")
+            if not isinstance(price_info, Mapping):
+                raise TypeError(
+                    f"stocks[{symbol}] must be a dict like {{'initial_price': ..., 'current_price': ...}}."
+                )
 
 
 def _get_price(
-    stocks: Dict[str, Dict[str, float]],
+    stocks: Mapping[str, Mapping[str, float]],
     symbol: str,
     price_key: str
 ) -> float:
     if symbol not in stocks:
         raise KeyError(f"Unknown stock symbol '{symbol}' (not found in stocks data).")
 
+    if isinstance(stocks, data_io.Stocks):
+        # Read straight from the price column; Stocks checked the values when it was built.
+        return stocks.price(symbol, price_key)
+
     price_info = stocks[symbol]
     if price_key not in price_info:
         raise KeyError(f"Missing '{price_key}' for symbol '{symbol}' in stocks data.")
@@ -60,28 +77,83 @@ def _get_price(
 
     return float(price)
 
+def _dot(qtys: List[int], prices: List[float]) -> float:
+    """
+        Internal helper: sum of qty * price over two parallel lists.
+  """
+    if _sumprod is not None:
+        return float(_sumprod(qtys, prices))
+    return math.fsum(map(operator.mul, qtys, prices))
+
+def _check_known_symbols(portfolio: Dict[str, int], stocks: data_io.Stocks) -> None:
+    missing = portfolio.keys() - stocks.index.keys()
+    if missing:
+        raise KeyError(f"Unknown stock symbol '{min(missing)}' (not found in stocks data).")
+
+def _qtys_and_prices(
+    portfolio: Dict[str, int],
+    stocks: Mapping[str, Mapping[str, float]],
+    price_key: str,
+) -> Tuple[List[int], List[float]]:
+    """
+        Internal helper: return two parallel lists (quantities, prices) in portfolio order,
+        so totals can be computed in one pass without per-holding dict work.
+  """
+    symbols = list(portfolio)
+    qtys = [portfolio[symbol] for symbol in symbols]
+
+    if isinstance(stocks, data_io.Stocks):
+        # Look up the price column once; Stocks checked its values when it was built.
+        _check_known_symbols(portfolio, stocks)
+        column = stocks.column(price_key)
+        index = stocks.index
+        prices = [column[index[symbol]] for symbol in symbols]
+    else:
+        prices = [_get_price(stocks, symbol, price_key) for symbol in symbols]
+    return qtys, prices
+
+def _portfolio_totals(
+    portfolio: Dict[str, int],
+    stocks: Mapping[str, Mapping[str, float]],
+) -> Tuple[float, float]:
+    """
+        Internal helper: return (current value, initial value) from a single walk over the holdings,
+        reading both prices of a stock together instead of walking the portfolio once per price.
+  """
+    qtys = list(portfolio.values())
+
+    if isinstance(stocks, data_io.Stocks):
+        _check_known_symbols(portfolio, stocks)
+        index = stocks.index
+        rows = [index[symbol] for symbol in portfolio]
+        current = [stocks.current[i] for i in rows]
+        initial = [stocks.initial[i] for i in rows]
+    else:
+        current = []
+        initial = []
+        for symbol in portfolio:
+            current.append(_get_price(stocks, symbol, "current_price"))
+            initial.append(_get_price(stocks, symbol, "initial_price"))
+
+    return _dot(qtys, current), _dot(qtys, initial)
+
 #  Calculate total portfolio value using a chosen price field.
 def portfolio_value(
     portfolio: Dict[str, int],
-    stocks: Dict[str, Dict[str, float]],
+    stocks: Mapping[str, Mapping[str, float]],
     price_key: str = "current_price",
 ) -> float:
     _validate_inputs(portfolio, stocks)
 
-    total = 0.0
-    # We loop through each holding in the portfolio:
-    # symbol = "AAPL", qty = 3
-    for symbol, qty in portfolio.items():
-        price = _get_price(stocks, symbol, price_key)
-        total += qty * price
-
-    return total
+    # Sum of qty * price over all holdings, e.g. AAPL: 3 * 165.0 + MSFT: 1 * 310.0
+    qtys, prices = _qtys_and_prices(portfolio, stocks, price_key)
+    return _dot(qtys, prices)
 
     # Calculate the initial investment (cost basis) of the portfolio.
 
 def portfolio_cost_basis(
     portfolio: Dict[str, int],
-    stocks: Dict[str, Dict[str, float]],
+    stocks: Mapping[str, Mapping[str, float]],
     price_key: str = "initial_price",
 ) -> float:
     return portfolio_value(portfolio, stocks, price_key=price_key)
@@ -89,7 +161,7 @@ def portfolio_cost_basis(
 
 def roi_percent(
     portfolio: Dict[str, int],
-    stocks: Dict[str, Dict[str, float]]
+    stocks: Mapping[str, Mapping[str, float]]
 ) -> float:
     """
         Calculate ROI (Return on Investment) in percent.
@@ -107,7 +179,6 @@ def roi_percent(
     if not portfolio:
         raise ValueError("Portfolio is empty. Buy shares or load a portfolio first.")
 
-    current_val = portfolio_value(portfolio, stocks, price_key="current_price")
-    initial_val = portfolio_cost_basis(portfolio, stocks, price_key="initial_price")
+    current_val, initial_val = _portfolio_totals(portfolio, stocks)
 
     return (current_val - initial_val) / initial_val * 100.0
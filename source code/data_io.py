@@ -1,35 +1,141 @@
 # Role A: Fabian Data
 
 import csv
+import importlib.util
+import io
+import os
+from array import array
+from collections.abc import Mapping
+from functools import lru_cache
 
+# Optional: pyarrow parses CSV columns in C, much faster than csv.DictReader on big files.
+# It is only imported when a file is actually loaded, so importing data_io stays cheap.
+USE_PYARROW = importlib.util.find_spec("pyarrow") is not None  # set to False to always use the csv module
 
-def load_stocks(path: str) -> dict:
+
+class Stocks(Mapping):
+    """
+    Stock prices stored column-wise instead of one small dict per symbol:
+    a symbol -> row index map plus two parallel float arrays.
+
+    Reading stocks["AAPL"] still returns {"initial_price": ..., "current_price": ...},
+    so a Stocks object can be passed wherever the shared stocks dict is expected.
+
+    The prices are checked here (one price of each kind per symbol, none negative),
+    so analysis and visualization can read them without checking every entry again.
+    """
+
+    def __init__(self, symbols, initial_prices, current_prices):
+        symbols = list(symbols)
+        self.initial = array("d", initial_prices)  # TypeError if a price is not a number
+        self.current = array("d", current_prices)
+        if not len(symbols) == len(self.initial) == len(self.current):
+            raise ValueError("Stocks needs exactly one initial and one current price per symbol.")
+        # min() runs over the whole array in C; only look for the symbol if a price is negative.
+        if symbols and (min(self.initial) < 0 or min(self.current) < 0):
+            symbol = next(
+                symbol for symbol, initial, current in zip(symbols, self.initial, self.current)
+                if initial < 0 or current < 0
+            )
+            raise ValueError(f"Prices cannot be negative for symbol '{symbol}'.")
+
+        self.index = {symbol: i for i, symbol in enumerate(symbols)}
+        # Sorted once here, so tables and symbol lists never have to re-sort.
+        self.sorted_symbols = sorted(self.index)
+
+    def __getitem__(self, symbol: str) -> dict:
+        i = self.index[symbol]
+        return {"initial_price": self.initial[i], "current_price": self.current[i]}
+
+    def __contains__(self, symbol) -> bool:
+        return symbol in self.index
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __repr__(self) -> str:
+        return f"Stocks({dict(self.items())!r})"
+
+    def column(self, price_key: str) -> array:
+        """Return the whole price column for "initial_price" or "current_price"."""
+        if price_key == "initial_price":
+            return self.initial
+        if price_key == "current_price":
+            return self.current
+        raise KeyError(f"Missing '{price_key}' in stocks data.")
+
+    def price(self, symbol: str, price_key: str) -> float:
+        """Return one price ("initial_price" or "current_price") without building a dict."""
+        return self.column(price_key)[self.index[symbol]]
+
+
+def _open_for_read(path: str):
+    """
+    Open a data file for reading as raw bytes with a large buffer.
+    Where available (Linux), O_NOATIME skips the access-time update on every load;
+    the OS only allows it for the file's owner, so fall back to a normal open otherwise.
+
+    http:// and https:// URLs are downloaded in one request and read from memory.
+    """
+    if isinstance(path, str) and path.startswith(("http://", "https://")):
+        import urllib.request  # only needed for URLs, and slow to import
+        with urllib.request.urlopen(path, timeout=30) as response:
+            return io.BytesIO(response.read())
+
+    noatime = getattr(os, "O_NOATIME", 0)
+    try:
+        fd = os.open(path, os.O_RDONLY | noatime)
+    except PermissionError:
+        if not noatime:
+            raise
+        fd = os.open(path, os.O_RDONLY)
+
+    try:
+        return os.fdopen(fd, "rb", buffering=1 << 20)
+    except OSError:  # e.g. the path is a folder
+        os.close(fd)
+        raise
+
+
+def load_stocks(path: str) -> Stocks:
     """
     Load stock data from a CSV file.
 
     Expected CSV header:
     symbol, initial_price, current_price
 
+    path can be a local file or an http(s):// URL (e.g. a published price feed).
+
     Returns:
-        dict like:
+        Stocks, which reads like:
         {
           "AAPL": {"initial_price": 150.0, "current_price": 165.0},
           ...
         }
     """
-    stocks = {}
+    if USE_PYARROW:
+        return _load_stocks_arrow(path)
 
-    with open(path, mode="r", encoding="utf-8") as file:
+    symbols = []
+    initial_prices = []
+    current_prices = []
+
+    with io.TextIOWrapper(_open_for_read(path), encoding="utf-8", newline="") as file:
         reader = csv.DictReader(file)
 
         # Basic header check (optional but helpful)
         required = ["symbol", "initial_price", "current_price"]
+        fieldnames = reader.fieldnames or []  # None for an empty file
         for col in required:
-            if col not in reader.fieldnames:
+            if col not in fieldnames:
                 raise ValueError(f"Stocks CSV is missing column '{col}'. Expected: {required}")
 
+        strip, upper = str.strip, str.upper  # looked up once, not on every row
         for row in reader:
-            symbol = row["symbol"].strip().upper()
+            symbol = upper(strip(row["symbol"]))
             if not symbol:
                 continue  # skip empty lines
 
@@ -42,15 +148,113 @@ def load_stocks(path: str) -> dict:
             if initial_price < 0 or current_price < 0:
                 raise ValueError(f"Prices cannot be negative for symbol '{symbol}'.")
 
-            stocks[symbol] = {
-                "initial_price": initial_price,
-                "current_price": current_price
-            }
+            symbols.append(symbol)
+            initial_prices.append(initial_price)
+            current_prices.append(current_price)
 
-    if not stocks:
+    if not symbols:
+        raise ValueError("No stocks loaded. The CSV may be empty.")
+
+    return Stocks(symbols, initial_prices, current_prices)
+
+
+def load_stocks_many(paths: list) -> Stocks:
+    """
+    Load several stocks CSVs (same format as load_stocks) and combine them into one Stocks.
+
+    The files are read in parallel threads, since most of the time is spent waiting on
+    the disk or network. If a symbol appears in more than one file, the later path wins.
+    """
+    if not paths:
+        raise ValueError("No stocks CSV paths given.")
+
+    from concurrent.futures import ThreadPoolExecutor  # only needed here, slow to import
+
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+        loaded = list(pool.map(load_stocks, paths))
+
+    symbols = []
+    initial_prices = array("d")
+    current_prices = array("d")
+    for stocks in loaded:
+        for symbol, i in stocks.index.items():
+            symbols.append(symbol)
+            initial_prices.append(stocks.initial[i])
+            current_prices.append(stocks.current[i])
+
+    return Stocks(symbols, initial_prices, current_prices)
+
+
+def _read_csv_arrow(path: str, required: list, what: str):
+    """
+    Read a CSV with pyarrow, keeping every column as text so rows with an empty symbol can
+    be dropped before any number is parsed (like the csv module path does).
+    Returns (table, symbols) with the empty-symbol rows removed and symbols normalized.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+
+    with _open_for_read(path) as file:
+        data = file.read()
+
+    if data.strip():
+        options = pacsv.ConvertOptions(column_types={col: pa.string() for col in required})
+        try:
+            table = pacsv.read_csv(pa.BufferReader(data), convert_options=options)
+        except pa.ArrowInvalid as exc:
+            raise ValueError(f"Could not read {what} CSV: {exc}") from exc
+        columns = table.column_names
+    else:
+        columns = []  # empty file: report it like the csv module path, as missing columns
+
+    for col in required:
+        if col not in columns:
+            raise ValueError(f"{what.capitalize()} CSV is missing column '{col}'. Expected: {required}")
+
+    symbols = pc.utf8_upper(pc.utf8_trim_whitespace(table["symbol"]))
+    keep = pc.not_equal(symbols, "")  # skip empty lines
+    return table.filter(keep), symbols.filter(keep).to_pylist()
+
+
+def _to_numbers_arrow(column, symbols: list, convert, message: str) -> list:
+    """
+    Convert a text column with pyarrow (convert is float or int, as in the csv module path)
+    and return the numbers as a list.
+    pyarrow's cast is stricter than float()/int() (e.g. "+5", "1_000", int beyond 64 bits),
+    so if it fails the column is converted with convert instead, and message is only raised
+    for the first value that convert rejects too.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    column = pc.utf8_trim_whitespace(column)
+    try:
+        return pc.cast(column, pa.float64() if convert is float else pa.int64()).to_pylist()
+    except pa.ArrowInvalid:
+        numbers = []
+        for symbol, value in zip(symbols, column.to_pylist()):
+            try:
+                numbers.append(convert(value))
+            except ValueError:
+                raise ValueError(message.format(symbol=symbol)) from None
+        return numbers
+
+
+def _load_stocks_arrow(path: str) -> Stocks:
+    """
+    pyarrow version of load_stocks: same checks and result, but the CSV is parsed
+    and the prices are converted column-wise instead of row by row.
+    """
+    required = ["symbol", "initial_price", "current_price"]
+    table, symbols = _read_csv_arrow(path, required, "stocks")
+    if not symbols:
         raise ValueError("No stocks loaded. The CSV may be empty.")
 
-    return stocks
+    message = "Invalid price value for symbol '{symbol}' (must be a number)."
+    initial = _to_numbers_arrow(table["initial_price"], symbols, float, message)
+    current = _to_numbers_arrow(table["current_price"], symbols, float, message)
+    return Stocks(symbols, initial, current)  # rejects negative prices like load_stocks
 
 
 def save_portfolio(path: str, portfolio: dict) -> None:
@@ -58,13 +262,13 @@ def save_portfolio(path: str, portfolio: dict) -> None:
     Save portfolio to CSV with header: symbol, shares
     portfolio example: {"AAPL": 2, "MSFT": 1}
     """
-    with open(path, mode="w", newline="", encoding="utf-8") as file:
+    # Large buffer so the whole file goes out in a few writes instead of one per row.
+    with open(path, mode="w", newline="", encoding="utf-8", buffering=1 << 20) as file:
         writer = csv.writer(file)
         writer.writerow(["symbol", "shares"])
 
-        for symbol, shares in portfolio.items():
-            # Keep it simple; assume other modules already keep it clean.
-            writer.writerow([symbol, shares])
+        # Keep it simple; assume other modules already keep it clean.
+        writer.writerows(portfolio.items())
 
 
 def load_portfolio(path: str) -> dict:
@@ -72,18 +276,23 @@ def load_portfolio(path: str) -> dict:
     Load portfolio from CSV with header: symbol, shares
     Returns dict like: {"AAPL": 2, "MSFT": 1}
     """
+    if USE_PYARROW:
+        return _load_portfolio_arrow(path)
+
     portfolio = {}
 
-    with open(path, mode="r", encoding="utf-8") as file:
+    with io.TextIOWrapper(_open_for_read(path), encoding="utf-8", newline="") as file:
         reader = csv.DictReader(file)
 
         required = ["symbol", "shares"]
+        fieldnames = reader.fieldnames or []  # None for an empty file
         for col in required:
-            if col not in reader.fieldnames:
+            if col not in fieldnames:
                 raise ValueError(f"Portfolio CSV is missing column '{col}'. Expected: {required}")
 
+        strip, upper = str.strip, str.upper  # looked up once, not on every row
         for row in reader:
-            symbol = row["symbol"].strip().upper()
+            symbol = upper(strip(row["symbol"]))
             if not symbol:
                 continue
 
@@ -99,22 +308,51 @@ def load_portfolio(path: str) -> dict:
     return portfolio
 
 
-def format_stock_table(stocks: dict) -> str:
+def _load_portfolio_arrow(path: str) -> dict:
+    """pyarrow version of load_portfolio (same checks and result)."""
+    table, symbols = _read_csv_arrow(path, ["symbol", "shares"], "portfolio")
+    message = "Invalid shares value for symbol '{symbol}' (must be a whole number)."
+    shares = _to_numbers_arrow(table["shares"], symbols, int, message)
+
+    # Contract in analysis/visualization: only keep qty > 0
+    return {symbol: qty for symbol, qty in zip(symbols, shares) if qty > 0}
+
+
+def format_stock_table(stocks: Mapping) -> str:
     """
     Return a printable table string for the 'View stocks' menu option.
     """
     if not stocks:
         return "No stocks available."
 
+    if isinstance(stocks, Stocks):
+        # Build the rows column by column from the price arrays, without a dict per stock.
+        symbols = stocks.sorted_symbols
+        order = [stocks.index[symbol] for symbol in symbols]
+        initial = [stocks.initial[i] for i in order]
+        current = [stocks.current[i] for i in order]
+        rows = tuple(zip(symbols, initial, current))
+    else:
+        rows = tuple(
+            (symbol, stocks[symbol]["initial_price"], stocks[symbol]["current_price"])
+            for symbol in sorted(stocks.keys())
+        )
+    return _stock_table(rows)
+
+
+@lru_cache(maxsize=8)
+def _stock_table(rows: tuple) -> str:
+    """
+    Build the table text from (symbol, initial, current) rows.
+    Cached, so viewing unchanged stocks again does not rebuild the string.
+    """
     lines = []
     lines.append("Available Stocks")
     lines.append("-" * 45)
     lines.append(f"{'SYMBOL':<10}{'INITIAL':>12}{'CURRENT':>12}")
     lines.append("-" * 45)
 
-    for symbol in sorted(stocks.keys()):
-        initial_p = stocks[symbol]["initial_price"]
-        current_p = stocks[symbol]["current_price"]
+    for symbol, initial_p, current_p in rows:
         lines.append(f"{symbol:<10}{initial_p:>12.2f}{current_p:>12.2f}")
 
     lines.append("-" * 45)
@@ -12,12 +12,13 @@ Responsibilities:
 
 from __future__ import annotations
 
-from typing import Callable, Dict, Optional, Tuple, Sequence, Set, Type, TypeVar, Union
+from typing import Callable, Dict, Mapping, Optional, Tuple, Sequence, Set, Type, TypeVar, Union
 
 import data_io
 import transactions
 import analysis
-import visualization
+# visualization is imported inside the pie chart action: it pulls in NumPy (and matplotlib
+# once a chart is drawn), which are slow to import and not needed for any other menu option.
 
 TEST_MODE = False  # set to False when integrating with data_io
                     # Fabian: set to false
@@ -33,9 +34,49 @@ except Exception:
     DEFAULT_PORTFOLIO_CSV = "portfolio.csv"
 
 
-StocksDict = Dict[str, Dict[str, float]]
+StocksDict = Mapping[str, Mapping[str, float]]  # plain dict or data_io.Stocks
 PortfolioDict = Dict[str, int]
 
+
+class _TrackedDict(dict):
+    """
+    Portfolio dict that counts its changes in .version.
+    Lets the menu (_cached_result) and visualization skip work for a portfolio that has not changed.
+    """
+    version = 0
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self.version += 1
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def pop(self, *args):
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self):
+        self.version += 1
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        self.version += 1
+        return super().setdefault(key, default)
+
+    def __ior__(self, other):
+        self.version += 1
+        return super().__ior__(other)
+
 #Helpers: Input validation. These helpers are UI-level utilities to validate user input.
 #They do not perform business logic (buy/sell/value), only input checking.
 T = TypeVar("T", int, str)
@@ -71,12 +112,12 @@ def prompt_choice(valid_choices: Sequence[T], prompt: str = "Choose an option: "
         print(f"Invalid choice. Allowed: {allowed}")
 
 
-def prompt_symbol(stocks: dict, prompt: str = "Enter stock symbol (e.g., AAPL): ") -> str:
+def prompt_symbol(stocks: StocksDict, prompt: str = "Enter stock symbol (e.g., AAPL): ") -> str:
     """
     Prompt for a ticker symbol until it exists in the stocks dict.
     Returns the validated symbol (uppercase).
     """
-    if not isinstance(stocks, dict) or not stocks:
+    if not isinstance(stocks, Mapping) or not stocks:
         raise ValueError("stocks must be a non-empty dictionary of available tickers.")
 
     while True:
@@ -166,6 +207,26 @@ def _safe_call(action_name: str, fn: Callable[[], None]) -> None:
         print(_friendly_error(action_name, exc))
 
 
+def _cached_result(cache: Dict[str, object], name: str, portfolio: Dict[str, int],
+                   compute: Callable[[], float]) -> float:
+    """
+    Return compute(), reusing the previous result while the portfolio is unchanged.
+    The key is the portfolio's identity and change counter (see _TrackedDict), so the check is O(1).
+    A plain dict has no change counter, so it is computed every time.
+    Stocks are loaded once at startup and never modified, so they are not part of the key.
+    """
+    version = getattr(portfolio, "version", None)
+    if version is None:
+        return compute()
+    key = (id(portfolio), version)
+    if cache.get("key") != key:
+        cache.clear()
+        cache["key"] = key
+    if name not in cache:
+        cache[name] = compute()
+    return cache[name]  # type: ignore[return-value]
+
+
 def _pause() -> None:
     """Pause so the user can read output before the menu shows again."""
     input("\nPress Enter to continue...")
@@ -203,9 +264,68 @@ def main_menu_loop() -> None:
             print("Exiting program.")
             return
 
-    portfolio: PortfolioDict = {}
+    portfolio: PortfolioDict = _TrackedDict()
     #portfolio = {"AAPL": 2, "MSFT": 1} #only for TESTING!
 
+    # Portfolio value/ROI from the last time they were shown (see _cached_result).
+    results_cache: Dict[str, object] = {}
+
+    # Menu actions are defined once here and looked up by choice below,
+    # instead of being re-created in an if/elif chain on every loop pass.
+    def view_stocks() -> None:
+        table = data_io.format_stock_table(stocks)
+        print(table)
+
+    def buy_shares() -> None:
+        symbol = prompt_symbol(stocks)
+        qty = prompt_positive_int("Quantity to buy: ")
+        transactions.buy(portfolio, stocks, symbol, qty)  # updates portfolio in place
+        print(f"Bought {qty} shares of {symbol}.")
+        _print_portfolio_summary(portfolio)
+
+    def sell_shares() -> None:
+        if not portfolio:
+            print("Portfolio is empty. Nothing to sell.")
+            return
+        symbol = prompt_symbol(stocks)
+        qty = prompt_positive_int("Quantity to sell: ")
+
+        # transactions.sell looks up the holding itself and raises if it is not owned.
+        transactions.sell(portfolio, symbol, qty)  # updates portfolio in place
+        print(f"Sold {qty} shares of {symbol}.")
+        _print_portfolio_summary(portfolio)
+
+    def show_value() -> None:
+        value = _cached_result(
+            results_cache, "value", portfolio,
+            lambda: analysis.portfolio_value(portfolio, stocks, price_key="current_price"),
+        )
+        print(f"Current portfolio value: {value:.2f}")
+
+    def show_roi() -> None:
+        roi = _cached_result(results_cache, "roi", portfolio, lambda: analysis.roi_percent(portfolio, stocks))
+        print(f"ROI: {roi:.2f}%")
+
+    def show_pie_chart() -> None:
+        if not portfolio:
+            print("Portfolio is empty. Buy shares or load a portfolio first.")
+            return
+        import visualization  # cached in sys.modules after the first chart
+        visualization.plot_allocation_pie(portfolio, stocks)
+
+    def save_portfolio() -> None:
+        path = _prompt_path("Save portfolio CSV path", DEFAULT_PORTFOLIO_CSV)
+        data_io.save_portfolio(path, portfolio)
+        print(f"Portfolio saved to '{path}'.")
+
+    def load_portfolio() -> None:
+        path = _prompt_path("Load portfolio CSV path", DEFAULT_PORTFOLIO_CSV)
+        loaded = data_io.load_portfolio(path)
+        portfolio.clear()
+        portfolio.update(loaded)
+        print(f"Portfolio loaded from '{path}'.")
+        _print_portfolio_summary(portfolio)
+
     menu_options: Tuple[Tuple[str, str], ...] = (
         ("1", "View available stocks"),
         ("2", "Buy shares"),
@@ -218,6 +338,18 @@ def main_menu_loop() -> None:
         ("9", "Exit"),
     )
 
+    # choice -> (action name used in error messages, action)
+    menu_actions: Dict[str, Tuple[str, Callable[[], None]]] = {
+        "1": ("View stocks", view_stocks),
+        "2": ("Buy", buy_shares),
+        "3": ("Sell", sell_shares),
+        "4": ("Portfolio value", show_value),
+        "5": ("ROI", show_roi),
+        "6": ("Pie chart", show_pie_chart),
+        "7": ("Save portfolio", save_portfolio),
+        "8": ("Load portfolio", load_portfolio),
+    }
+
     while True:
         _print_menu(menu_options)
 
@@ -227,100 +359,14 @@ def main_menu_loop() -> None:
             "Choose an option (1-9): "
         )
 
-        if choice == "1":
-            def action() -> None:
-                table = data_io.format_stock_table(stocks)
-                print(table)
-
-            _safe_call("View stocks", action)
-            _pause()
-
-        elif choice == "2":
-            def action() -> None:
-                symbol = prompt_symbol(stocks)
-                qty = prompt_positive_int("Quantity to buy: ")
-                updated = transactions.buy(portfolio, stocks, symbol, qty)
-                #portfolio.clear()
-                #portfolio.update(updated)
-                print(f"Bought {qty} shares of {symbol}.")
-                _print_portfolio_summary(portfolio)
-
-            _safe_call("Buy", action)
-            _pause()
-
-        elif choice == "3":
-            def action() -> None:
-                if not portfolio:
-                    print("Portfolio is empty. Nothing to sell.")
-                    return
-                symbol = prompt_symbol(stocks)
-                qty = prompt_positive_int("Quantity to sell: ")
-
-                owned = portfolio.get(symbol, 0)
-                if owned == 0:
-                    print(f"You do not own any shares of {symbol}.")
-                    return
-
-                updated = transactions.sell(portfolio, stocks, symbol, qty)
-                #portfolio.clear()
-                #portfolio.update(updated)
-                print(f"Sold {qty} shares of {symbol}.")
-                _print_portfolio_summary(portfolio)
-
-            _safe_call("Sell", action)
-            _pause()
-
-        elif choice == "4":
-            def action() -> None:
-                value = analysis.portfolio_value(portfolio, stocks, price_key="current_price")
-                print(f"Current portfolio value: {value:.2f}")
-
-            _safe_call("Portfolio value", action)
-            _pause()
-
-        elif choice == "5":
-            def action() -> None:
-                roi = analysis.roi_percent(portfolio, stocks)
-                print(f"ROI: {roi:.2f}%")
-
-            _safe_call("ROI", action)
-            _pause()
-
-        elif choice == "6":
-            def action() -> None:
-                if not portfolio:
-                    print("Portfolio is empty. Buy shares or load a portfolio first.")
-                    return
-                visualization.plot_allocation_pie(portfolio, stocks)
-
-            _safe_call("Pie chart", action)
-            _pause()
-
-        elif choice == "7":
-            def action() -> None:
-                path = _prompt_path("Save portfolio CSV path", DEFAULT_PORTFOLIO_CSV)
-                data_io.save_portfolio(path, portfolio)
-                print(f"Portfolio saved to '{path}'.")
-
-            _safe_call("Save portfolio", action)
-            _pause()
-
-        elif choice == "8":
-            def action() -> None:
-                path = _prompt_path("Load portfolio CSV path", DEFAULT_PORTFOLIO_CSV)
-                loaded = data_io.load_portfolio(path)
-                portfolio.clear()
-                portfolio.update(loaded)
-                print(f"Portfolio loaded from '{path}'.")
-                _print_portfolio_summary(portfolio)
-
-            _safe_call("Load portfolio", action)
-            _pause()
-
-        elif choice == "9":
+        if choice == "9":
             print("Goodbye.")
             break
 
+        action_name, action = menu_actions[choice]
+        _safe_call(action_name, action)
+        _pause()
+
 
 
 if __name__ == "__main__":
@@ -0,0 +1,75 @@
+"""
+Checks that the pyarrow and csv module loaders in data_io give the same result
+(or the same error) for the same file.
+
+Run with pytest, or directly: python test_data_io.py
+"""
+
+import os
+import tempfile
+
+import data_io
+
+STOCKS_CSVS = [
+    "symbol,initial_price,current_price\nAAPL,150,165\nMSFT,+5,1_000\n",
+    "symbol,initial_price,current_price\nAAPL,150,165\nMSFT,1e3, inf \n",
+    "symbol,initial_price,current_price\nAAPL,150,165\nMSFT,abc,1\n",
+    "symbol,initial_price,current_price\n,abc,\nAAPL,1,2\n",
+    "symbol,initial_price,current_price\nAAPL,1,-2\nMSFT,-1,2\n",
+    "symbol,initial_price,current_price\nAAPL,1,\n",
+    "symbol,initial_price,current_price\n",
+    "symbol,initial_price\nAAPL,1\n",
+    "",
+]
+
+PORTFOLIO_CSVS = [
+    "symbol,shares\nAAPL,1\nMSFT,+5\n",
+    "symbol,shares\nAAPL,1_000\nMSFT,99999999999999999999\n",
+    "symbol,shares\nAAPL,３\nMSFT,0\nIBM,-2\n",
+    "symbol,shares\nAAPL,1\nMSFT,1.5\n",
+    "symbol,shares\n ,x\nAAPL,2\n",
+    "symbol\nAAPL\n",
+    "",
+]
+
+
+def _load_both(load, text: str) -> list:
+    """Load text with USE_PYARROW off and on; each result is the value or (error type, message)."""
+    with tempfile.NamedTemporaryFile("w", suffix=".csv", encoding="utf-8", delete=False) as file:
+        file.write(text)
+    saved = data_io.USE_PYARROW
+    results = []
+    try:
+        for use_pyarrow in (False, True):
+            data_io.USE_PYARROW = use_pyarrow
+            try:
+                result = load(file.name)
+                results.append(dict(result.items()))
+            except (ValueError, TypeError) as exc:
+                results.append((type(exc).__name__, str(exc)))
+    finally:
+        data_io.USE_PYARROW = saved
+        os.remove(file.name)
+    return results
+
+
+def test_load_stocks_parity():
+    if not data_io.USE_PYARROW:
+        return  # pyarrow not installed, only the csv module path exists
+    for text in STOCKS_CSVS:
+        csv_result, arrow_result = _load_both(data_io.load_stocks, text)
+        assert csv_result == arrow_result, (text, csv_result, arrow_result)
+
+
+def test_load_portfolio_parity():
+    if not data_io.USE_PYARROW:
+        return
+    for text in PORTFOLIO_CSVS:
+        csv_result, arrow_result = _load_both(data_io.load_portfolio, text)
+        assert csv_result == arrow_result, (text, csv_result, arrow_result)
+
+
+if __name__ == "__main__":
+    test_load_stocks_parity()
+    test_load_portfolio_parity()
+    print("data_io loaders agree.")
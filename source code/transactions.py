@@ -30,23 +30,24 @@ def buy(portfolio: dict, stocks: dict, symbol: str, qty: int) -> dict:
     if symbol not in stocks:
         raise ValueError(f"Stock '{symbol}' not found in database.")
 
-    # 3. Logic: Add stock or create new entry
+    # 3. Logic: Add stock or create new entry (no if/else needed)
     # .get(symbol, 0) retrieves the current value or 0 if it doesn't exist yet.
-    current_qty = portfolio.get(symbol, 0)
-    portfolio[symbol] = current_qty + qty
+    portfolio[symbol] = portfolio.get(symbol, 0) + qty
 
     return portfolio
 
 
-def sell(portfolio: dict, stocks: dict, symbol: str, qty: int) -> dict:
+def sell(portfolio: dict, symbol: str, qty: int, *, stocks: dict | None = None) -> dict:
     """
     Removes a specific quantity of shares from the portfolio.
 
     Args:
         portfolio (dict): The current portfolio holdings.
-        stocks (dict): The list of all available stocks (kept for interface consistency).
         symbol (str): The stock ticker symbol.
         qty (int): The quantity to sell.
+        stocks (dict, optional): Not used; selling only needs the portfolio.
+            Keyword-only: the old positional form sell(portfolio, stocks, symbol, qty)
+            is no longer accepted and raises TypeError; use sell(portfolio, symbol, qty).
 
     Returns:
         dict: The updated portfolio.
@@ -59,18 +60,21 @@ def sell(portfolio: dict, stocks: dict, symbol: str, qty: int) -> dict:
         raise ValueError("Quantity must be greater than 0.")
 
     # 2. Validation: Does the user own this stock?
-    if symbol not in portfolio:
+    # Look the holding up once and reuse it for the checks below.
+    owned = portfolio.get(symbol)
+    if owned is None:
         raise ValueError(f"You do not own any shares of '{symbol}'.")
 
     # 3. Validation: Does the user have ENOUGH shares to sell?
-    if portfolio[symbol] < qty:
-        raise ValueError(f"Insufficient shares. You have {portfolio[symbol]}, but tried to sell {qty}.")
+    if owned < qty:
+        raise ValueError(f"Insufficient shares. You have {owned}, but tried to sell {qty}.")
 
     # 4. Logic: Deduct shares
-    portfolio[symbol] -= qty
-
     # 5. Cleanup: If quantity reaches 0, remove the entry completely
-    if portfolio[symbol] == 0:
+    remaining = owned - qty
+    if remaining == 0:
         del portfolio[symbol]
+    else:
+        portfolio[symbol] = remaining
 
     return portfolio
\ No newline at end of file
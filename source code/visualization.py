@@ -4,43 +4,84 @@ This module produces a pie chart showing each stock's share of the total portfol
 
 from __future__ import annotations
 
-from typing import Dict
+from functools import partial
+from typing import TYPE_CHECKING, Dict, Mapping, Optional
 
-import matplotlib.pyplot as plt
+import numpy as np
 
+import data_io
 
-def _validate_inputs(portfolio: Dict[str, int], stocks: Dict[str, Dict[str, float]]) -> None:
+# matplotlib.pyplot is imported inside the functions that draw: importing it loads the
+# plotting backend and dozens of modules, which only the pie chart menu option needs.
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+# One figure reused by every displayed pie chart instead of creating a new one on each call.
+_FIGURE = None
+
+# Last portfolio that passed validation, with its .version at that time. Portfolios that
+# count their changes (menu._TrackedDict) are only re-checked after they changed.
+_VALIDATED = None
+
+
+def _validate_inputs(portfolio: Dict[str, int], stocks: Mapping[str, Mapping[str, float]]) -> None:
 
     if not isinstance(portfolio, dict):
         raise TypeError("portfolio must be a dict like {'AAPL': 3, 'MSFT': 1}")
-    if not isinstance(stocks, dict):
+    if not isinstance(stocks, Mapping):
         raise TypeError("stocks must be a dict like {'AAPL': {'initial_price': 150.0, 'current_price': 165.0}}")
 
-    for symbol, qty in portfolio.items():
-        if not isinstance(symbol, str):
-            raise TypeError("portfolio keys (symbols) must be strings.")
-        if not isinstance(qty, int):
-            raise TypeError(f"portfolio quantity for {symbol} must be int, got {type(qty).__name__}.")
-        if qty <= 0:
-            raise ValueError(f"portfolio must only contain tickers with qty > 0. Found {symbol}: {qty}.")
-
-    for symbol, price_info in stocks.items():
-        if not isinstance(symbol, str):
-            raise TypeError("stocks keys (symbols) must be strings.")
-        if not isinstance(price_info, dict):
+    global _VALIDATED
+    version = getattr(portfolio, "version", None)
+    unchanged = (
+        version is not None and _VALIDATED is not None
+        and _VALIDATED[0] is portfolio and _VALIDATED[1] == version
+    )
+
+    # Fast path: one all() over the holdings; the loop only runs to find out what is wrong.
+    if not unchanged and not all(
+        type(symbol) is str and type(qty) is int and qty > 0 for symbol, qty in portfolio.items()
+    ):
+        for symbol, qty in portfolio.items():
+            if not isinstance(symbol, str):
+                raise TypeError("portfolio keys (symbols) must be strings.")
+            if not isinstance(qty, int):
+                raise TypeError(f"portfolio quantity for {symbol} must be int, got {type(qty).__name__}.")
+            if qty <= 0:
+                raise ValueError(f"portfolio must only contain tickers with qty > 0. Found {symbol}: {qty}.")
+    if not unchanged and version is not None:
+        _VALIDATED = (portfolio, version)
+
+    if isinstance(stocks, data_io.Stocks):
+        return  # data_io.Stocks checks its prices when it is built
+
+    # The chart only reads the stocks held in the portfolio, so only those entries are checked
+    # (a set difference first, instead of walking every stock).
+    missing = portfolio.keys() - stocks.keys()
+    if missing:
+        raise KeyError(f"Unknown stock symbol '{min(missing)}' (not found in stocks data).")
+    for symbol in portfolio:
+        if not isinstance(stocks[symbol], Mapping):
             raise TypeError(f"stocks[{symbol}] must be a dict.")
 
 
-def _get_current_price(stocks: Dict[str, Dict[str, float]], symbol: str) -> float:
+def _get_current_price(stocks: Mapping[str, Mapping[str, float]], symbol: str) -> float:
 
-    if symbol not in stocks:
-        raise KeyError(f"Unknown stock symbol '{symbol}' (not found in stocks data).")
+    # Look things up directly and only turn a KeyError into a clearer message if it happens,
+    # instead of checking membership first and then looking the same key up again.
+    try:
+        if isinstance(stocks, data_io.Stocks):
+            return stocks.price(symbol, "current_price")
+        info = stocks[symbol]
+    except KeyError:
+        raise KeyError(f"Unknown stock symbol '{symbol}' (not found in stocks data).") from None
 
-    info = stocks[symbol]
-    if "current_price" not in info:
-        raise KeyError(f"Missing 'current_price' for symbol '{symbol}' in stocks data.")
+    try:
+        price = info["current_price"]
+    except KeyError:
+        raise KeyError(f"Missing 'current_price' for symbol '{symbol}' in stocks data.") from None
 
-    price = info["current_price"]
     if not isinstance(price, (int, float)):
         raise TypeError(f"Price for {symbol}.current_price must be a number, got {type(price).__name__}.")
     if price < 0:
@@ -49,12 +90,48 @@ def _get_current_price(stocks: Dict[str, Dict[str, float]], symbol: str) -> floa
     return float(price)
 
 
-def plot_allocation_pie(portfolio: Dict[str, int], stocks: Dict[str, Dict[str, float]]) -> None:
+def _figure_is_open() -> bool:
+    """True if the shared figure exists and its window has not been closed."""
+    if _FIGURE is None:
+        return False
+    import matplotlib.pyplot as plt
+    return plt.fignum_exists(_FIGURE.number)
+
+
+def _get_axes():
+    """
+    Return empty axes on the shared pie chart figure.
+    A new figure is only created the first time, or after the user closed the chart window.
+    """
+    import matplotlib.pyplot as plt
+
+    global _FIGURE
+    if not _figure_is_open():
+        _FIGURE = plt.figure()
+    else:
+        plt.figure(_FIGURE.number)  # make it the current figure again
+        _FIGURE.clear()
+    return _FIGURE.add_subplot()
+
+
+def _show_figure() -> None:
+    """Bring the shared figure back to the front and show it."""
+    import matplotlib.pyplot as plt
+    plt.figure(_FIGURE.number)
+    plt.show()
+
+
+def plot_allocation_pie(
+    portfolio: Dict[str, int],
+    stocks: Mapping[str, Mapping[str, float]],
+    show: bool = True,
+) -> Optional[Figure]:
     """
     Plot a pie chart showing how the portfolio's total *current value* is allocated across stocks.
     - Create a pie chart that shows what share of total portfolio value comes from each stock.
     - Use matplotlib.
     - It can simply display the chart (plt.show()).
+    - With show=False nothing is displayed; a new Figure is returned instead (e.g. for fig.savefig).
     """
     _validate_inputs(portfolio, stocks)
 
@@ -63,22 +140,51 @@ def plot_allocation_pie(portfolio: Dict[str, int], stocks: Dict[str, Dict[str, f
         # Raising an error is clearer than showing an empty chart.
         raise ValueError("Cannot plot allocation: portfolio is empty.")
 
-    labels = []
-    values = []
+    labels = list(portfolio)
+    n = len(labels)
 
     # Build data for the pie chart: value_per_stock = quantity * current_price
-    for symbol, qty in portfolio.items():
-        current_price = _get_current_price(stocks, symbol)
-        labels.append(symbol)
-        values.append(qty * current_price)
-
-    total_value = sum(values)
+    # (as NumPy arrays, so the multiply and the sum below run in one go instead of per stock)
+    qtys = np.fromiter(portfolio.values(), dtype=np.int64, count=n)
+    if isinstance(stocks, data_io.Stocks):
+        # One flat symbol -> row lookup per stock, then read the current price column directly
+        # (np.frombuffer shares the array's memory, no copy). Stocks checked the prices.
+        missing = portfolio.keys() - stocks.index.keys()
+        if missing:
+            raise KeyError(f"Unknown stock symbol '{min(missing)}' (not found in stocks data).")
+        rows = np.fromiter(map(stocks.index.__getitem__, labels), dtype=np.intp, count=n)
+        prices = np.frombuffer(stocks.current, dtype=np.float64)[rows]
+    else:
+        prices = np.fromiter(map(partial(_get_current_price, stocks), labels), dtype=np.float64, count=n)
+    values = qtys * prices
+
+    total_value = values.sum()
     if total_value <= 0:
         raise ValueError("Cannot plot allocation: total portfolio value is zero or negative.")
 
-    # Plot
-    plt.figure()  # create a new figure, so plots don't overlap in interactive sessions
-    plt.pie(values, labels=labels, autopct="%1.1f%%")
-    plt.title("Portfolio Allocation (by Current Value)")
-    plt.axis("equal")  # makes the pie chart a circle
-    plt.show()
+    # Percentages are worked out once here and written into the labels (instead of autopct),
+    # and stocks below 1% are grouped into one "Other" slice so tiny slices don't each get text.
+    percents = values / total_value * 100.0
+    small = percents < 1.0
+    if np.count_nonzero(small) > 1:
+        keep = ~small
+        labels = [label for label, kept in zip(labels, keep) if kept] + ["Other"]
+        values = np.append(values[keep], values[small].sum())
+        percents = np.append(percents[keep], percents[small].sum())
+    wedge_labels = [f"{label} {percent:.1f}%" for label, percent in zip(labels, percents)]
+
+    if show:
+        # Plot on the reused figure, cleared first so plots don't overlap in interactive sessions
+        ax = _get_axes()
+    else:
+        # A figure of the caller's own: not registered with pyplot, and never cleared
+        # or redrawn by a later call the way the shared one is.
+        from matplotlib.figure import Figure
+        ax = Figure().add_subplot()
+    ax.pie(values, labels=wedge_labels)
+    ax.set_title("Portfolio Allocation (by Current Value)")
+    ax.axis("equal")  # makes the pie chart a circle
+    if not show:
+        return ax.figure
+    _show_figure()
+    return None